@@ -1,5 +1,5 @@
 from flask import Blueprint, request, jsonify, current_app
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from infrastructure.models.user_model import UserModel
 from infrastructure.databases.mssql import session
 from api.schemas.auth import RigisterUserRequestSchema,RigisterUserResponseSchema
@@ -76,7 +76,7 @@ def login():
 
     payload = {
         'user_id': user.id,
-        'exp': datetime.utcnow() + timedelta(hours=2)
+        'exp': datetime.now(timezone.utc) + timedelta(hours=2)
     }
     token = jwt.encode(payload, current_app.config['SECRET_KEY'], algorithm='HS256')
     return jsonify({'token': token})
@@ -119,18 +119,10 @@ def register():
     if errors:
       return jsonify(errors), 400
     # Lay thong tin tu nguoi dung truyen vao
-
-    # Support JSON body and avoid KeyError by using .get()
-    username = data.get('username') if isinstance(data, dict) else None
-    password = data.get('password') if isinstance(data, dict) else None
-    passwordconfirm = data.get('passwordconfirm') if isinstance(data, dict) else None
-    email = data.get('email') if isinstance(data, dict) else None
-
-    if not username or not password or not passwordconfirm or not email:
-      return jsonify({'message': 'Missing required fields: username, password, passwordconfirm, email'}), 400
-
-    if password != passwordconfirm:
-      return jsonify({'message': 'Passwords do not match'}), 400
+    # Required fields and password confirmation are checked by register_request
+    username = data['username']
+    password = data['password']
+    email = data['email']
 
     if auth_service.check_exist(username):
       return jsonify({'message': 'User already exists. Please login.'}), 400
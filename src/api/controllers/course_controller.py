@@ -63,13 +63,14 @@ def update_todo(todo_id):
     errors = request_schema.validate(data)
     if errors:
         return jsonify(errors), 400
+    now = datetime.utcnow()
     todo = todo_service.update_todo(
         todo_id=todo_id,
         title=data['title'],
         description=data['description'],
         status=data['status'],
-        created_at=datetime.utcnow(),  # Có thể lấy từ DB nếu cần
-        updated_at=datetime.utcnow()
+        created_at=now,  # Có thể lấy từ DB nếu cần
+        updated_at=now
     )
     return jsonify(response_schema.dump(todo)), 200
 
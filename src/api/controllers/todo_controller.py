@@ -170,13 +170,14 @@ def update_todo(todo_id):
     errors = request_schema.validate(data)
     if errors:
         return jsonify(errors), 400
+    now = datetime.utcnow()
     todo = todo_service.update_todo(
         todo_id=todo_id,
         title=data['title'],
         description=data['description'],
         status=data['status'],
-        created_at=datetime.utcnow(),
-        updated_at=datetime.utcnow()
+        created_at=now,
+        updated_at=now
     )
     return jsonify(response_schema.dump(todo)), 200
 
@@ -1,10 +1,16 @@
-from marshmallow import Schema, fields
+from marshmallow import Schema, fields, validate, validates_schema, ValidationError
 
 class RigisterUserRequestSchema(Schema):
-    username = fields.Str(required=True)
-    password = fields.Str(required=True)
-    passwordconfirm = fields.Str(required=True)
+    username = fields.Str(required=True, validate=validate.Length(min=1))
+    password = fields.Str(required=True, validate=validate.Length(min=1))
+    passwordconfirm = fields.Str(required=True, validate=validate.Length(min=1))
     email = fields.Email(required=True)
+
+    @validates_schema
+    def validate_passwords_match(self, data, **kwargs):
+        if data.get('password') != data.get('passwordconfirm'):
+            raise ValidationError('Passwords do not match', 'passwordconfirm')
+
 class RigisterUserResponseSchema(Schema):
     username = fields.Str(required=True)
     # password = fields.Str(required=True)
@@ -2,6 +2,8 @@ from datetime import date
 
 
 class Course:
+    __slots__ = ('id', 'course_name', 'description', 'status', 'start_date', 'end_date', 'created_at', 'updated_at')
+
     def __init__(self, id: int, course_name: str, description: str, status: str,start_date :date ,end_date:date,created_at, updated_at):
         self.id = id
         self.course_name = course_name
@@ -1,4 +1,6 @@
 class Todo:
+    __slots__ = ('id', 'title', 'description', 'status', 'created_at', 'updated_at')
+
     def __init__(self, id: int, title: str, description: str, status: str, created_at, updated_at):
         self.id = id
         self.title = title
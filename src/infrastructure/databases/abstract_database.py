@@ -6,10 +6,17 @@ from contextlib import contextmanager
 from config import DevelopmentConfig,Config, FactoryConfig
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+
+# Engines shared per database URI, so every repository reuses the same
+# connection pool and SQLAlchemy compiled statement cache
+_engines = {}
+
 class AbstractDatabase(ABC):
     def __init__(self):
         self.database_uri = FactoryConfig.get_config("development").DATABASE_URI
-        self.engine = create_engine(self.database_uri)
+        self.engine = _engines.get(self.database_uri)
+        if self.engine is None:
+            self.engine = _engines[self.database_uri] = create_engine(self.database_uri)
         self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
         self.session = self.SessionLocal()
     @abstractmethod
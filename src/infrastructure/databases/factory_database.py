@@ -6,11 +6,15 @@ from infrastructure.databases.database_postgres import DatabasePostgres
 
 
 class FactoryDatabase:
+    # Database type -> database class
+    DATABASES = {
+        'MSSQL': DatabaseMSSQL,
+        'POSTGREE': DatabasePostgres,
+    }
+
     @staticmethod
     def get_database(database_type)-> AbstractDatabase:
-        if database_type == 'MSSQL':
-            return DatabaseMSSQL()
-        if database_type == 'POSTGREE':
-            # Return PostgreSQL database instance
-            return DatabasePostgres()
-        raise ValueError(f"Unsupported database type: {database_type}") 
\ No newline at end of file
+        database_class = FactoryDatabase.DATABASES.get(database_type)
+        if database_class is None:
+            raise ValueError(f"Unsupported database type: {database_type}")
+        return database_class() 
\ No newline at end of file
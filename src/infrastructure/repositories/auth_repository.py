@@ -65,10 +65,9 @@ class AuthRepository(IAuthRepository):
         pass
     def check_exist(self, username: str) -> bool:
         # Implement check exist logic here
-        existing_user = self.session.query(AuthUserModel).filter_by(username = username).first()
-        if existing_user:
-            return True
-        return False
+        # Only the id column is selected, the full row is never loaded
+        existing_user_id = self.session.query(AuthUserModel.id).filter_by(username = username).first()
+        return existing_user_id is not None
     
 
     
@@ -15,31 +15,27 @@ load_dotenv()
 
 class CourseRepository(ICourseRepository):
     def __init__(self):
-        self._courses = []
+        # Courses indexed by id for O(1) lookups
+        self._courses = {}
         self._id_counter = 1
 
     def add(self, course: Course) -> Course:
         course.id = self._id_counter
         self._id_counter += 1
-        self._todos.append(course)
+        self._courses[course.id] = course
         return course
 
     def get_by_id(self, course_id: int) -> Optional[Course]:
-        for course in self._courses:
-            if course.id == course_id:
-                return course
-        return None
+        return self._courses.get(course_id)
 
     def list(self) -> List[Course]:
-        return self._courses
+        return list(self._courses.values())
 
     def update(self, course: Course) -> Course:
-        for idx, t in enumerate(self._courses):
-            if t.id == course.id:
-                self._courses[idx] = course
-                return course
-        raise ValueError('course not found')
+        if course.id not in self._courses:
+            raise ValueError('course not found')
+        self._courses[course.id] = course
+        return course
 
     def delete(self, course_id: int) -> None:
-        self._courses = [t for t in self._courses if t.id != course_id] 
-
+        self._courses.pop(course_id, None)
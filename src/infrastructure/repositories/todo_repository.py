@@ -70,7 +70,16 @@ class TodoRepository(ITodoRepository):
                 created_at=todo.created_at,
                 updated_at=todo.updated_at
             )
-            self.session.merge(todo)
+            # Single UPDATE ... WHERE id, no SELECT round trip as with merge()
+            updated = self.session.query(TodoModel).filter_by(id=todo.id).update({
+                'title': todo.title,
+                'description': todo.description,
+                'status': todo.status,
+                'created_at': todo.created_at,
+                'updated_at': todo.updated_at
+            }, synchronize_session=False)
+            if not updated:
+                raise ValueError('Todo not found')
             self.session.commit()
             return todo
         except Exception as e:
@@ -82,12 +91,11 @@ class TodoRepository(ITodoRepository):
     def delete(self, todo_id: int) -> None:
         # self._todos = [t for t in self._todos if t.id != todo_id] 
         try:
-            todo = self.session.query(TodoModel).filter_by(id=todo_id).first()
-            if todo:
-                self.session.delete(todo)
-                self.session.commit()
-            else:
+            # Single DELETE ... WHERE id instead of loading the row first
+            deleted = self.session.query(TodoModel).filter_by(id=todo_id).delete(synchronize_session=False)
+            if not deleted:
                 raise ValueError('Todo not found')
+            self.session.commit()
         except Exception as e:
             self.session.rollback()
             raise ValueError('Todo not found')
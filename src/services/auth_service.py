@@ -7,9 +7,8 @@ class AuthService:
         self.repository = repository
 
     def register(self, username: str, password: str, email: str) -> Optional[Auth]:
-        # Check if user already exists
-        if self.repository.check_exist(username):
-            return None  # User already exists
+        # Duplicate usernames are rejected by the unique constraint on insert,
+        # the repository returns None in that case
         auth = Auth(
             username=username,
             password=password,